@@ -1,3 +1,14 @@
+import os
+
 import setuptools
 
-setuptools.setup()
\ No newline at end of file
+# Set COMMIT_MSG_LINTER_USE_MYPYC=1 (with mypy installed, e.g. building with
+# --no-build-isolation) to compile the hook into a C extension with mypyc.
+# Without it the package is pure Python.
+ext_modules = []
+if os.environ.get("COMMIT_MSG_LINTER_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["src/commit_msg/hook.py"])
+
+setuptools.setup(ext_modules=ext_modules)
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 
+import re
 import sys
-import textwrap
-from enum import Enum
-from typing import List, Final
+from dataclasses import dataclass
+from typing import Any, Final, Optional
 import argparse
 
 ###############################################################################
@@ -11,31 +11,79 @@ import argparse
 ###############################################################################
 COMMIT_EDITMSG: Final[str] = ".git/COMMIT_EDITMSG"
 
+VALID_COMMIT_TYPES: Final = ("feat", "fix", "refactor", "style",
+                             "docs", "test", "chore", "revert")
+
+# title prefixes of the valid commit types
+_TYPE_PREFIXES: Final = tuple(f"{t}:" for t in VALID_COMMIT_TYPES)
+
+# title prefixes of the commit types that must reference an issue
+_ISSUE_REQUIRED_PREFIXES: Final = ("feat:", "fix:")
+
+VALID_ISSUE_TRACKERS: Final = (("jr", "jira"), ("gh", "github"),
+                               ("gl", "gitlab"), ("bb", "bitbucket"),
+                               ("lp", "launchpad"))
+
+_HANDLES: Final = "|".join(handle for handle, _ in VALID_ISSUE_TRACKERS)
+
+# issue tracker handle followed by the token that should hold the issue number
+_ISSUE_RE: Final = re.compile(rf"({_HANDLES}):(\S*)")
+
+# The whole well-formed commit message in one pass. It only accepts what
+# every validator accepts (line lengths count the newline, as they do);
+# anything else goes through the validators so the report says what failed.
+_ISSUE_TYPES: Final = "|".join(p[:-1] for p in _ISSUE_REQUIRED_PREFIXES)
+_OTHER_TYPES: Final = "|".join(
+    t for t in VALID_COMMIT_TYPES if f"{t}:" not in _ISSUE_REQUIRED_PREFIXES
+)
+_COMMIT_OK: Final = re.compile(
+    rf"""
+    (?=[^\n]{{0,49}}\n)                        # title within 50
+    (?:
+        (?:{_ISSUE_TYPES}):
+        (?=(?:(?!(?:{_HANDLES}):)[^\n])*      # first tracker handle
+           (?:{_HANDLES}):\d+(?!\S))           # has an issue number
+      | (?:{_OTHER_TYPES}):
+    )
+    [^\n]*\n
+    [^\S\n]*\n                                 # blank separator
+    (?:[^\n]{{0,71}}\n)+                        # body within 72
+    (?:[^\S\n]+|[^\S\n]*\n)\Z                  # blank trailing line
+    """,
+    re.VERBOSE,
+)
+
 ###############################################################################
 #                              CONSOLE UTILITIES                              #
 ###############################################################################
 
-class StatusColors(str, Enum):
-    """A Enum for colors using ANSI escape sequences.
-    Referece: 
-    - https://stackoverflow.com/questions/287871
-    """
-
-    OK = "\033[92m"
-    INFO = "\033[94m"
-    WARNING = "\033[93m"
-    ERROR = "\033[91m"
-    BOLD = "\033[1m"
-    ENDC = "\033[0m"
-
-class Level(str, Enum):
-    """A Enum for message levels .
-    """
-
-    OK = "OK"
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
+# Colors using ANSI escape sequences.
+# Reference:
+# - https://stackoverflow.com/questions/287871
+C_OK: Final[str] = "\033[92m"
+C_INFO: Final[str] = "\033[94m"
+C_WARNING: Final[str] = "\033[93m"
+C_ERROR: Final[str] = "\033[91m"
+C_BOLD: Final[str] = "\033[1m"
+C_END: Final[str] = "\033[0m"
+
+# Message levels.
+LEVEL_OK: Final[str] = "OK"
+LEVEL_INFO: Final[str] = "INFO"
+LEVEL_WARNING: Final[str] = "WARNING"
+LEVEL_ERROR: Final[str] = "ERROR"
+
+# ANSI escape sequences at the start of a message, which take no columns
+_ANSI_PREFIX_RE: Final = re.compile(r"(?:\033\[[0-9;]*m)*")
+
+# full color, bold and label prefix of each level and the reset suffix
+_MSG_PREFIX: Final[dict[str, str]] = {
+    LEVEL_OK: f"{C_OK}{C_BOLD}{LEVEL_OK}: ",
+    LEVEL_INFO: f"{C_INFO}{C_BOLD}{LEVEL_INFO}: ",
+    LEVEL_WARNING: f"{C_WARNING}{C_BOLD}{LEVEL_WARNING}: ",
+    LEVEL_ERROR: f"{C_ERROR}{C_BOLD}{LEVEL_ERROR}: ",
+}
+_MSG_SUFFIX: Final[str] = C_END
 
 def linter_text_padding(text: str, width: int=72, 
                  side: bool=True, symbol: str=" ") -> str:
@@ -47,341 +95,332 @@ def linter_text_padding(text: str, width: int=72,
     symbol: The symbol to pad with.
     """
     if not side:
-        return f"{symbol * (width - len(text))}{text}"
-    
-    return f"{text}{symbol * (width - len(text))}"
+        return text.rjust(width, symbol)
+
+    return text.ljust(width, symbol)
 
-def linter_message(message: str, level: Level) -> str:
+def _wrap72(text: str, indent: str="        ") -> str:
+    """
+    Returns the single-line text wrapped to 72 columns.
+    Lines break at the last space that fits, or at 72 columns when there is
+    none, and the following lines are indented. Leading ANSI escape
+    sequences are not counted. Spaces around the breaks are dropped.
+    """
+    width = 72
+    match = _ANSI_PREFIX_RE.match(text)
+    start = match.end() if match else 0
+    limit = start + width
+    lines = []
+    while len(text) > limit:
+        cut = text.rfind(" ", start, limit + 1)
+        if cut == -1:
+            cut = limit
+        lines.append(text[:cut].rstrip(" "))
+        rest = text[cut:].lstrip(" ")
+        if not rest:
+            return "\n".join(lines)
+        text = indent + rest
+        start = len(indent)
+        limit = width
+    lines.append(text.rstrip(" "))
+    return "\n".join(lines)
+
+def linter_message(message: str, level: str) -> str:
     """Returns a message with appropriate policy colors and line wrapping."""
-    
-    policy_message = StatusColors[level] \
-        + StatusColors.BOLD \
-        + f"{level}: " \
-        + message \
-        + StatusColors.ENDC
-
-    return textwrap.fill(
-        policy_message, width=72, subsequent_indent="        "
-    )
+    return _wrap72(_MSG_PREFIX[level] + message) + _MSG_SUFFIX
 
 ###############################################################################
 #                            COMMIT TRANSFORMER                               #
 ###############################################################################
-def get_commit_message(msg_temp_file, keep_comments=False) -> List[str]:
+@dataclass
+class CommitMessage:
+    """The commit message lines split into the parts the validators check.
+    title: The first line.
+    separator: The line between the title and the body, stripped.
+    body: The lines between the separator and the trailing line.
+    trailer: The last line, stripped.
+    raw: All the lines of the commit message.
+    """
+    title: str
+    separator: str
+    body: list[str]
+    trailer: str
+    raw: list[str]
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "CommitMessage":
+        """Returns a CommitMessage for the lines of a commit message.
+        The lines must have passed has_title_and_body (at least 4 lines)."""
+        return cls(
+            title=lines[0],
+            separator=lines[1].strip(),
+            body=lines[2:-1],
+            trailer=lines[-1].strip(),
+            raw=lines,
+        )
+
+def get_commit_message(msg_temp_file: str,
+                       keep_comments: bool=False) -> list[str]:
     """Returns the commit message as a list of lines from the temporary file"""
-    commit_message = None
     with open(msg_temp_file, "r", encoding="utf-8") as f_msg:
-        commit_message = f_msg.readlines()
-    
-    if not keep_comments:
-        commit_message = [
-            line 
-            for line in commit_message 
-            if not line.strip().startswith("#")
+        return [
+            line
+            for line in f_msg
+            if keep_comments or not line.lstrip().startswith("#")
         ]
-    
-    return commit_message
 
 ###############################################################################
 #                                 Validators                                  #
 ###############################################################################
-def has_title_and_body(commit_message: List[str]) -> tuple:
-    """Returns (True, None) if the commit message has a title and body."""
-    return (len(commit_message) >= 4,None)
-
-
-def title_within_max_length(commit_message: List[str]) -> tuple:
-    """Returns (True, None) if the title is within the maximum length.
-    Returns (False, max_length) if a line is too long."""
+# Validator result codes.
+CODE_OK: Final[int] = 0
+CODE_NO_TITLE_AND_BODY: Final[int] = 1
+CODE_TITLE_TOO_LONG: Final[int] = 2
+CODE_NO_SEPARATOR: Final[int] = 3
+CODE_NO_TRAILING_LINE: Final[int] = 4
+CODE_BODY_TOO_LONG: Final[int] = 5
+CODE_BAD_COMMIT_TYPE: Final[int] = 6
+CODE_BAD_TRACKER: Final[int] = 7
+CODE_NO_ISSUE_NUMBER: Final[int] = 8
+
+@dataclass
+class Result:
+    """The outcome of a validator.
+    ok: True if the check passed.
+    code: CODE_OK, or the CODE_* of the failure.
+    hint: Detail for the failure message, None when there is none.
+    """
+    ok: bool
+    code: int
+    hint: Any
+
+# shared result of every check that passes
+PASSED: Final = Result(True, CODE_OK, None)
+
+def has_title_and_body(commit_message: list[str]) -> Result:
+    """Returns PASSED if the commit message has a title and body.
+    Returns Result(False, CODE_NO_TITLE_AND_BODY, None) otherwise.
+    This is the length gate: the other validators assume it has passed and
+    that the message has a title, separator, body and trailing line."""
+    if len(commit_message) >= 4:
+        return PASSED
+    return Result(False, CODE_NO_TITLE_AND_BODY, None)
+
+
+def title_within_max_length(commit_message: CommitMessage) -> Result:
+    """Returns PASSED if the title is within the maximum length.
+    Returns Result(False, CODE_TITLE_TOO_LONG, max_length) if it is too
+    long."""
     max_length = 50
-    title = commit_message[0]
-    if len(title) > max_length:
-        return (False, max_length)
-    return (True, None)
+    if len(commit_message.title) > max_length:
+        return Result(False, CODE_TITLE_TOO_LONG, max_length)
+    return PASSED
 
-def has_title_body_separator(commit_message: List[str]) -> tuple:
+def has_title_body_separator(commit_message: CommitMessage) -> Result:
     """
     When title and body are separated by a blank line.
-    Returns: (True, None)
-    Status: True
-    Hint: Not Provided
+    Returns: PASSED
 
     When there is no blank line between title and body.
-    Returns: (False, line_number)
-    Status: False
+    Returns: Result(False, CODE_NO_SEPARATOR, None)
     Hint: Not Provided
     """
-    return (commit_message[1].strip() == "", None)
+    if commit_message.separator == "":
+        return PASSED
+    return Result(False, CODE_NO_SEPARATOR, None)
 
-def has_trailing_line(commit_message: List[str]) -> tuple:
+def has_trailing_line(commit_message: CommitMessage) -> Result:
     """
     When there is a trailing line at the end of the commit message.
-    Returns: (True, None)
-    Status: True
-    Hint: Not Provided
+    Returns: PASSED
 
     When there is no trailing line at the end of the commit message.
-    Returns: (False, line_number)
-    Status: False
+    Returns: Result(False, CODE_NO_TRAILING_LINE, None)
     Hint: Not Provided
     """
-    return (commit_message[-1].strip() == "", None)
-
-def body_within_max_length(commit_message: List[str]) -> tuple:
-    """Returns (True, None) if the body is within the maximum length.
-    Returns (False, line_number) if a line is too long."""
-    # exclude the title and the separator and the trailing line
-    body = commit_message[2:-1]
-    
-    for line_number, line in enumerate(body, start=1):
-        if len(line) > 72:
-            return (False, line_number)
-
-    return (True, None)
-
-def title_starts_with_commit_type(commit_message: List[str]) -> tuple:
+    if commit_message.trailer == "":
+        return PASSED
+    return Result(False, CODE_NO_TRAILING_LINE, None)
+
+def body_within_max_length(commit_message: CommitMessage) -> Result:
+    """Returns PASSED if the body is within the maximum length.
+    Returns Result(False, CODE_BODY_TOO_LONG, line_number) if a line is too
+    long."""
+    max_length = 72
+    lengths = list(map(len, commit_message.body))
+    if max(lengths, default=0) <= max_length:
+        return PASSED
+
+    # report the first line (1-based) that is too long
+    return Result(False, CODE_BODY_TOO_LONG,
+                  next(line_number
+                       for line_number, length in enumerate(lengths, start=1)
+                       if length > max_length))
+
+def title_starts_with_commit_type(commit_message: CommitMessage) -> Result:
     """
     When the title starts with the commit type.
-    Returns: (True, None)
-    Status: True
-    Hint: Not Provided
+    Returns: PASSED
 
     When the title does not start with the commit type.
-    Returns: (False, List[Valid Commit Types])
-    Status: False
-    Hint: List of valid commit types
+    Returns: Result(False, CODE_BAD_COMMIT_TYPE, Tuple[Valid Commit Types])
+    Hint: Tuple of valid commit types
     """
-    valid_commit_types = ["feat", "fix", "refactor", "style", 
-                          "docs", "test", "chore", "revert"]
-    
-    title = commit_message[0]
-    for commit_type in valid_commit_types:
-        if title.startswith(f"{commit_type}:"):
-            return (True, None)
-    
-    return (False, valid_commit_types)
+    if commit_message.title.startswith(_TYPE_PREFIXES):
+        return PASSED
+
+    return Result(False, CODE_BAD_COMMIT_TYPE, VALID_COMMIT_TYPES)
 
-def commit_type_require_issue_number(commit_message: List[str]) -> tuple:
-    """Returns (True, None) if the commit type requires an issue number.
-    Returns (False, None) if the commit type does not require an issue number.
+def commit_type_require_issue_number(commit_message: CommitMessage) -> bool:
+    """Returns True if the commit type requires an issue number.
+    Returns False if the commit type does not require an issue number.
     """
-    title = commit_message[0]
-    if title.startswith("feat:") or title.startswith("fix:"):
-        return (True, None)
-    return (False, None)
+    return commit_message.title.startswith(_ISSUE_REQUIRED_PREFIXES)
 
 # Detailed Checks
-def title_has_issue_number(commit_message: List[str]) -> tuple:
+def title_has_issue_number(commit_message: CommitMessage) -> Result:
     """
     When an issue tracker handle has been found followed by an issue number.
-    Returns: (True, None)
-    Status: True
-    Hint: Not Provided
+    Returns: PASSED
 
     When an issue tracker handle hasn't been found
-    Returns: (False, List[(IssueTrackerHandle, IssueTrackerLongName),...])
-    Status: False
-    Hint: List of Issue Tracker Handles with Long Names
+    Returns: Result(False, CODE_BAD_TRACKER,
+                    Tuple[(IssueTrackerHandle, IssueTrackerLongName),...])
+    Hint: Tuple of Issue Tracker Handles with Long Names
 
     When an isue tracker handle has been found but no issue number
-    Returns: (False,(None, False))
-    Status: False
-    Hint: None to indicate Issue Tracker is correct 
-          False to indicate no issue number
+    Returns: Result(False, CODE_NO_ISSUE_NUMBER, IssueTrackerHandle)
+    Hint: The handle that has no issue number
     """
-    title = commit_message[0]
-    valid_issue_tracker_prefixes = [('jr:', 'jira'), ('gh:', 'github'),
-                                    ('gl:', 'gitlab'),('bb:', 'bitbucket'),
-                                    ('lp:', 'launchpad')]
-    for issue_tracker, _ in valid_issue_tracker_prefixes:
-        if issue_tracker in title:
-            # get the issue number from the title
-            issue_number = title.split(issue_tracker)[1].split()[0]
-            if issue_number.isdigit():
-                return (True, None)
-            else:
-                return (False, (None, False))
-    
-    return (False, valid_issue_tracker_prefixes)
+    match = _ISSUE_RE.search(commit_message.title)
+    if match is None:
+        return Result(False, CODE_BAD_TRACKER, VALID_ISSUE_TRACKERS)
+
+    # the issue number is the token right after the handle
+    if match.group(2).isdigit():
+        return PASSED
+    return Result(False, CODE_NO_ISSUE_NUMBER, match.group(1))
 
 ###############################################################################
 #                                LINTER                                       #
 ###############################################################################
-def lint_commit_message(commit_message: List[str]=None):
-    """The main function of the commit-msg hook."""
-    if commit_message is None:
-        commit_message = get_commit_message(sys.argv[1], keep_comments=False)
-
-    flag, hint = has_title_and_body(commit_message)
-    if not flag:
-        print(
-            linter_message(
-                "Title and Body are required",
-                Level.ERROR
-            )
-        )
-        return 1
-    else:
-        print(
-            linter_message(
-                "Commit Message has a title and body.", Level.OK
-            )
+# Structural checks run in order until one fails, after has_title_and_body.
+# (validator, ok message)
+_CHECKS: Final = (
+    (title_within_max_length, "Title is within the maximum length."),
+    (has_title_body_separator,
+     "Commit Message has a blank line between title and body."),
+    (has_trailing_line, "Commit message has a trailing line."),
+    (body_within_max_length,
+     "Commit Body lines are within the maximum length."),
+    (title_starts_with_commit_type, "Title starts with a valid commit type."),
+)
+
+# examples of every valid issue tracker, one per line once wrapped
+_TRACKERS_HINT: Final = linter_text_padding(
+    "List of Valid Issue Trackers e.g:"
+) + "".join(
+    linter_text_padding(f"for {name} -> {handle}:123")
+    for handle, name in VALID_ISSUE_TRACKERS
+)
+
+# failure code -> (error message, hint format or None)
+# the hint format is filled in with Result.hint
+_MSG_TABLE: Final = {
+    CODE_NO_TITLE_AND_BODY: ("Title and Body are required", None),
+    CODE_TITLE_TOO_LONG: ("Title is too long:", "Max Length: {}"),
+    CODE_NO_SEPARATOR:
+        ("A blank line is required between the title and body", None),
+    CODE_NO_TRAILING_LINE:
+        ("A blank line is required at the end of the commit message", None),
+    CODE_BODY_TOO_LONG: ("Commit Body lines are too long:", "Line {}"),
+    CODE_BAD_COMMIT_TYPE: (
+        "Title must start with a valid commit type",
+        "Valid Commit Types: " + ", ".join(VALID_COMMIT_TYPES),
+    ),
+    CODE_BAD_TRACKER: ("Issue Tracker is not valid.", _TRACKERS_HINT),
+    CODE_NO_ISSUE_NUMBER: (
+        "Issue Tracker is valid but no issue number provided.",
+        _TRACKERS_HINT,
+    ),
+}
+
+def _report_failure(result: Result, out: list[str]) -> int:
+    """Appends the error and hint lines of a failed check to out.
+    Returns the exit status of the hook."""
+    error_message, hint_format = _MSG_TABLE[result.code]
+    out.append(linter_message(error_message, LEVEL_ERROR))
+    if hint_format is not None:
+        out.append(
+            linter_message(hint_format.format(result.hint), LEVEL_INFO)
         )
+    return 1
+
+def _run_checks(commit_message: list[str], out: list[str]) -> int:
+    """Runs the validators on the message, appending the report lines to out.
+    Returns the exit status of the hook."""
+    if _COMMIT_OK.match("".join(commit_message)):
+        out.append(linter_message("Commit message is well-formed.", LEVEL_OK))
+        return 0
+
+    # the validators below rely on the message having at least 4 lines
+    result = has_title_and_body(commit_message)
+    if not result.ok:
+        return _report_failure(result, out)
+    out.append(
+        linter_message("Commit Message has a title and body.", LEVEL_OK)
+    )
 
-    flag, hint = title_within_max_length(commit_message)
-    if not flag:
-        print(linter_message("Title is too long:", Level.ERROR), 
-              linter_message(f"Max Length: {hint}", Level.INFO))
-        return 1
-    else:
-        print(
-            linter_message(
-                "Title is within the maximum length.", Level.OK
-            )
-        )
+    message = CommitMessage.from_lines(commit_message)
+    for check, ok_message in _CHECKS:
+        result = check(message)
+        if not result.ok:
+            return _report_failure(result, out)
+        out.append(linter_message(ok_message, LEVEL_OK))
 
-    flag, hint = has_title_body_separator(commit_message)
-    if not flag:
-        print(
-            linter_message(
-                "A blank line is required between the title and body",
-                Level.ERROR
-            )
-        )
-        return 1
-    else:
-        print(
+    if not commit_type_require_issue_number(message):
+        out.append(
             linter_message(
-                "Commit Message has a blank line between title and body.",
-                Level.OK
+                "Commit type does not require an issue number.",
+                LEVEL_INFO
             )
         )
+        return 0
 
-    flag, hint = has_trailing_line(commit_message)
-    if not flag:
-        print(
-            linter_message(
-                "A blank line is required at the end of the commit message",
-                Level.ERROR
-            )
-        )
-        return 1
-    else:
-        print(
-            linter_message(
-                "Commit message has a trailing line.",
-                Level.OK
-            )
-        )
-    
-    flag, hint = body_within_max_length(commit_message)
-    if not flag:
-        print(
-            linter_message(
-                "Commit Body lines are too long:",
-                Level.ERROR
-            ),
-            linter_message(
-                f"Line {hint}",
-                Level.INFO
-            )
-        )
-        return 1
-    else:
-        print(
-            linter_message(
-                "Commit Body lines are within the maximum length.",
-                Level.OK
-            )
-        )
-    
-    flag, hint = title_starts_with_commit_type(commit_message)
-    if not flag:
-        print(
-            linter_message(
-                "Title must start with a valid commit type", 
-                Level.ERROR
-            ),
-            "\n",
-            linter_message(
-                f"Valid Commit Types: {hint}",
-                Level.INFO
-            )
-        )
-        return 1
-    else:
-        print(
-            linter_message(
-                "Title starts with a valid commit type.",
-                Level.OK
-            )
+    out.append(
+        linter_message(
+            "Commit type requires an issue number checking.....",
+            LEVEL_INFO
         )
+    )
 
-    flag, hint = commit_type_require_issue_number(commit_message)
-    if flag is False:
-                print(
-            linter_message(
-                "Commit type does not require an issue number.",
-                Level.INFO
-            )
-        )
-    else:
-        print(
-            linter_message(
-                "Commit type requires an issue number checking.....",
-                Level.INFO
-            )
+    result = title_has_issue_number(message)
+    if not result.ok:
+        return _report_failure(result, out)
+    out.append(
+        linter_message(
+            "Commit Message has a valid issue number.",
+            LEVEL_OK
         )
+    )
+    return 0
 
-        flag, hint = title_has_issue_number(commit_message)
-        # there is an issue number in the title
-        if not flag:
-            # check if the issue tracker is valid
-            if type(hint) is list:
-                message_hint = \
-                    linter_message(
-                        "Issue Tracker is not valid.",
-                        Level.ERROR
-                    ) + \
-                    "\n"
-            elif type(hint) is tuple:
-                message_hint = \
-                    linter_message(
-                        "Issue Tracker is valid but no issue number provided.",
-                        Level.ERROR
-                    ) + \
-                    "\n"
-                
-            # get hints for valid issue trackers
-            tracker_hints = ""
-            for handle, name in hint:
-                issue_tracker_hint = f"for {name} -> {handle}:123"
-                tracker_hints += linter_text_padding(
-                    text=issue_tracker_hint
-                )
-            # build the message hint
-            message_hint += linter_message(
-                linter_text_padding("List of Valid Issue Trackers e.g:")
-                + tracker_hints,
-                Level.INFO
-            )
-
-            print(message_hint)
-            return 1
-        else:
-            print(
-                linter_message(
-                    "Commit Message has a valid issue number.",
-                    Level.OK
-                )
-            )
+def lint_commit_message(commit_message: Optional[list[str]]=None) -> int:
+    """The main function of the commit-msg hook."""
+    if commit_message is None:
+        commit_message = get_commit_message(sys.argv[1], keep_comments=False)
 
-    return 0
+    # collect the whole report and write it out at once
+    out: list[str] = []
+    try:
+        return _run_checks(commit_message, out)
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 ###############################################################################
 #                                MAIN                                         #
 ###############################################################################
-def main():
+def main() -> int:
     """
     Perform validations of the commit message.
     Extract arguments from command line and run the hook logic
@@ -393,7 +432,7 @@ def main():
     args = parser.parse_args()
     msg = get_commit_message(args.path, keep_comments=False)
     if not msg or len(msg) == 0:
-        print(linter_message("Commit Message is empty", Level.ERROR))
+        print(linter_message("Commit Message is empty", LEVEL_ERROR))
         sys.exit(1)
     
     return lint_commit_message(msg)